@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from scipy.special import ndtr, stdtr
+
+try:
+    from numba import njit
+
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - numba is an optional speed-up
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+
+        return wrap
+
+
+# Batched test statistics used by the simulations.
+#
+# Every kernel works on a whole batch of simulated experiments at once:
+# 2-D inputs have one row per trial and one column per user, and the result
+# is a 1-D array with one two-sided p-value per trial.
+#
+# Tail probabilities come straight from scipy.special (stdtr, ndtr) on whole
+# arrays. scipy.stats distribution objects would add per-call dispatch
+# overhead for the same numbers.
+
+
+def _normal_two_sided_p(diff: np.ndarray, se: np.ndarray) -> np.ndarray:
+    """
+    Two-sided normal p-values for diff / se, with p = 1 wherever se is 0.
+
+    A zero standard error means there is no variation in either group, so
+    there is no evidence of a difference (rather than an undefined 0 / 0).
+    """
+    z = np.divide(diff, se, out=np.zeros_like(se), where=se > 0.0)
+    return 2.0 * ndtr(-np.abs(z))
+
+
+@njit(cache=True)
+def _row_mean_var_compiled(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    trials, n = x.shape
+    means = np.empty(trials)
+    variances = np.empty(trials)
+    for i in range(trials):
+        total = 0.0
+        for j in range(n):
+            total += x[i, j]
+        mean = total / n
+
+        sum_sq = 0.0
+        for j in range(n):
+            dev = x[i, j] - mean
+            sum_sq += dev * dev
+        means[i] = mean
+        variances[i] = sum_sq / (n - 1)
+    return means, variances
+
+
+def row_mean_var(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Per-row mean and sample variance (ddof=1), accumulated in float64.
+
+    With Numba this is a compiled two-pass loop over each row, which avoids
+    the (trials, n) deviation array that np.var allocates.
+    """
+    if _HAVE_NUMBA:
+        return _row_mean_var_compiled(x)
+    return x.mean(axis=1, dtype=np.float64), x.var(axis=1, ddof=1, dtype=np.float64)
+
+
+def welch_p(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Welch t-test p-values for the difference in means (b - a), per row.
+    """
+    mean_a, var_a = row_mean_var(a)
+    mean_b, var_b = row_mean_var(b)
+    return welch_p_from_moments(mean_a, var_a, a.shape[1], mean_b, var_b, b.shape[1])
+
+
+def welch_p_from_moments(
+    mean_a: np.ndarray,
+    var_a: np.ndarray,
+    n_a: int,
+    mean_b: np.ndarray,
+    var_b: np.ndarray,
+    n_b: int,
+) -> np.ndarray:
+    """
+    welch_p from per-row sample means and variances (ddof=1).
+    """
+    se2_a = var_a / n_a
+    se2_b = var_b / n_b
+
+    se2 = se2_a + se2_b
+    df = se2**2 / (se2_a**2 / (n_a - 1) + se2_b**2 / (n_b - 1))
+    t = (mean_b - mean_a) / np.sqrt(se2)
+    return 2.0 * stdtr(df, -np.abs(t))
+
+
+# Normal draws are generated and reduced in blocks of trials whose float32
+# buffer stays within about half of a typical 1 MiB L2 cache.
+_BLOCK_BYTES = 512 * 1024
+
+
+def block_buffer(trials: int, n_per_group: int) -> np.ndarray:
+    """
+    Scratch buffer for draw_normal_moments, one block of trials by n_per_group.
+    """
+    rows = max(1, min(trials, _BLOCK_BYTES // (4 * n_per_group)))
+    return np.empty((rows, n_per_group), dtype=np.float32)
+
+
+def draw_normal_moments(
+    rng: np.random.Generator,
+    buffer: np.ndarray,
+    trials: int,
+    mean: float,
+    standard_deviation: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Draw one group of normal data and reduce it to per-trial (mean, variance).
+
+    Trials are drawn a block at a time into buffer (see block_buffer) and
+    reduced before the next block overwrites it, so memory stays bounded however
+    many trials are run. Blocks are filled in order, so the values drawn do not
+    depend on the block size. Shift and scale are applied to the moments rather
+    than to every draw, since the mean of mean + sd * x is mean + sd * mean(x)
+    and its variance is sd**2 * var(x).
+    """
+    means = np.empty(trials)
+    variances = np.empty(trials)
+    block = buffer.shape[0]
+
+    for start in range(0, trials, block):
+        stop = min(start + block, trials)
+        rows = buffer[: stop - start]
+        rng.standard_normal(dtype=np.float32, out=rows)
+        means[start:stop], variances[start:stop] = row_mean_var(rows)
+
+    return mean + standard_deviation * means, standard_deviation**2 * variances
+
+
+def two_prop_p(
+    successes_a: np.ndarray, successes_b: np.ndarray, n_per_group: int
+) -> np.ndarray:
+    """
+    Pooled two-proportion z-test p-values, one per pair of success counts.
+    """
+    n = float(n_per_group)
+    p_a = successes_a / n
+    p_b = successes_b / n
+    pooled = (successes_a + successes_b) / (2.0 * n)
+    se = np.sqrt(pooled * (1.0 - pooled) * (2.0 / n))
+
+    # If nobody (or everybody) converted in both groups, se is 0 and
+    # _normal_two_sided_p reports p = 1.
+    return _normal_two_sided_p(p_b - p_a, se)
+
+
+def _ratio_and_variance(
+    num: np.ndarray, den: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Per-row ratio sum(num) / sum(den) and its delta-method variance.
+
+    den may be a single row of shape (n,), shared by every trial.
+    """
+    den = np.broadcast_to(den, num.shape)
+    n = num.shape[1]
+    mean_num = num.mean(axis=1, dtype=np.float64)
+    mean_den = den.mean(axis=1, dtype=np.float64)
+    dev_num = num - mean_num[:, None]
+    dev_den = den - mean_den[:, None]
+
+    var_num = np.einsum("ij,ij->i", dev_num, dev_num) / (n - 1)
+    var_den = np.einsum("ij,ij->i", dev_den, dev_den) / (n - 1)
+    cov = np.einsum("ij,ij->i", dev_num, dev_den) / (n - 1)
+
+    ratio = mean_num / mean_den
+    variance = (var_num - 2.0 * ratio * cov + ratio**2 * var_den) / (n * mean_den**2)
+    return ratio, variance
+
+
+def ratio_delta_p(
+    num_a: np.ndarray, num_b: np.ndarray, den_a: np.ndarray, den_b: np.ndarray
+) -> np.ndarray:
+    """
+    Delta-method p-values for the difference in ratio metrics (b - a), per row.
+
+    Denominators that are the same for every trial can be passed as 1-D arrays.
+    """
+    ratio_a, var_a = _ratio_and_variance(num_a, den_a)
+    ratio_b, var_b = _ratio_and_variance(num_b, den_b)
+    se = np.sqrt(var_a + var_b)
+
+    return _normal_two_sided_p(ratio_b - ratio_a, se)
+
+
+def purchase_ratio_p(
+    successes_a: np.ndarray,
+    successes_b: np.ndarray,
+    n_per_group: int,
+    purchase_amount: float,
+) -> np.ndarray:
+    """
+    ratio_delta_p for revenue per visitor, computed from purchase counts alone.
+
+    With one visitor per user and a numerator of either 0 or purchase_amount,
+    the denominators have no variance and the delta-method moments reduce to
+    closed forms in the number of purchasers k:
+
+        ratio    = purchase_amount * k / n
+        variance = purchase_amount**2 * k * (n - k) / (n**2 * (n - 1))
+
+    so there is no need to draw individual users.
+    """
+    n = float(n_per_group)
+    amount2 = purchase_amount * purchase_amount
+    ratio_a = purchase_amount * successes_a / n
+    ratio_b = purchase_amount * successes_b / n
+    var_a = amount2 * successes_a * (n - successes_a) / (n * n * (n - 1.0))
+    var_b = amount2 * successes_b * (n - successes_b) / (n * n * (n - 1.0))
+    se = np.sqrt(var_a + var_b)
+
+    return _normal_two_sided_p(ratio_b - ratio_a, se)
+
+
+# Scalar kernel for confidence intervals.
+#
+# This is about a microsecond of float arithmetic, called a handful of times
+# per report, so it stays plain Python: compiling it with Numba would cost far
+# more on first call than it could ever save. It does no input validation; the
+# wrapper in simlab.intervals raises ValueError before calling it.
+
+
+def wilson_bounds(successes: int, trials: int, z: float) -> tuple[float, float, float]:
+    """
+    Wilson score interval as (estimate, low, high) for 0 <= successes <= trials.
+    """
+    z2 = z * z
+    n = float(trials)
+
+    # At 0 or trials successes phat * (1 - phat) = 0 and the interval has a
+    # closed form. This skips the sqrt, and avoids center - half_width
+    # rounding to a tiny nonzero value instead of exactly 0 (or 1).
+    if successes == 0:
+        return 0.0, 0.0, z2 / (n + z2)
+    if successes == trials:
+        return 1.0, n / (n + z2), 1.0
+
+    phat = successes / n
+    denom = 1.0 + z2 / n
+    center = (phat + z2 / (2.0 * n)) / denom
+    half_width = (z / denom) * math.sqrt(
+        (phat * (1.0 - phat) / n) + (z2 / (4.0 * n * n))
+    )
+
+    low = max(0.0, center - half_width)
+    high = min(1.0, center + half_width)
+    return phat, low, high
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import numpy.typing as npt
+from scipy.special import ndtri
+
+from simlab._kernels import wilson_bounds
 
 
 @dataclass(frozen=True)
@@ -9,6 +15,8 @@ class ProportionInterval:
     """
     Confidence interval for a proportion.
 
+    Fields are floats, or NumPy arrays when wilson_interval is given arrays.
+
     estimate:
         Point estimate of the proportion.
 
@@ -21,71 +29,42 @@ class ProportionInterval:
     high: float
 
 
-def _normal_inverse_cdf(p: float) -> float:
+def _normal_inverse_cdf(p: float | npt.ArrayLike) -> float | np.ndarray:
     """
-    Approximate inverse CDF for a standard normal distribution.
+    Inverse CDF of the standard normal distribution (scipy.special.ndtri).
 
-    This matches the style used in your other repos and is accurate enough
-    for confidence intervals and planning utilities.
+    p may also be an array, in which case an array of the same shape is returned.
     """
-    if not (0.0 < p < 1.0):
+    if isinstance(p, float):
+        if not (0.0 < p < 1.0):
+            raise ValueError("p must be between 0 and 1 (exclusive).")
+        return float(ndtri(p))
+
+    p = np.asarray(p, dtype=np.float64)
+    if np.any((p <= 0.0) | (p >= 1.0)):
         raise ValueError("p must be between 0 and 1 (exclusive).")
+    return ndtri(p)
 
-    a = [
-        -3.969683028665376e01,
-        2.209460984245205e02,
-        -2.759285104469687e02,
-        1.383577518672690e02,
-        -3.066479806614716e01,
-        2.506628277459239e00,
-    ]
-    b = [
-        -5.447609879822406e01,
-        1.615858368580409e02,
-        -1.556989798598866e02,
-        6.680131188771972e01,
-        -1.328068155288572e01,
-    ]
-    c = [
-        -7.784894002430293e-03,
-        -3.223964580411365e-01,
-        -2.400758277161838e00,
-        -2.549732539343734e00,
-        4.374664141464968e00,
-        2.938163982698783e00,
-    ]
-    d = [
-        7.784695709041462e-03,
-        3.224671290700398e-01,
-        2.445134137142996e00,
-        3.754408661907416e00,
-    ]
-
-    plow = 0.02425
-    phigh = 1.0 - plow
-
-    if p < plow:
-        q = math.sqrt(-2.0 * math.log(p))
-        return (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) / (
-            (((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1.0
-        )
 
-    if p > phigh:
-        q = math.sqrt(-2.0 * math.log(1.0 - p))
-        return -(
-            (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5])
-            / ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1.0)
-        )
+@lru_cache(maxsize=32)
+def _z_for(confidence: float) -> float:
+    """
+    Two-sided critical value for a confidence level (1.96 for 0.95).
+
+    Reports ask for the same confidence level over and over, so cache it.
+    """
+    return _normal_inverse_cdf(0.5 + confidence / 2.0)
+
 
-    q = p - 0.5
-    r = q * q
-    return (
-        (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q
-    ) / ((((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1.0))
+# z-values for the confidence levels reports actually use, computed once at import.
+_Z_TABLE = {c: _z_for(c) for c in (0.90, 0.95, 0.99)}
 
 
 def wilson_interval(
-    successes: int, trials: int, *, confidence: float = 0.95
+    successes: int | npt.ArrayLike,
+    trials: int | npt.ArrayLike,
+    *,
+    confidence: float = 0.95,
 ) -> ProportionInterval:
     """
     Wilson score interval for a binomial proportion.
@@ -103,25 +82,58 @@ def wilson_interval(
     The Wilson interval behaves well even when the estimate is near 0 or 1,
     and it tends to perform better than the basic "p ± z * sqrt(p(1-p)/n)" interval.
 
+    successes and trials may also be arrays (for example one entry per sweep row).
+    All intervals are then computed in one pass and the returned ProportionInterval
+    holds NumPy arrays instead of floats.
+
     Returns a ProportionInterval (estimate, low, high).
     """
-    if trials <= 0:
-        raise ValueError("trials must be positive.")
-    if successes < 0 or successes > trials:
-        raise ValueError("successes must be between 0 and trials.")
     if confidence <= 0.0 or confidence >= 1.0:
         raise ValueError("confidence must be between 0 and 1 (exclusive).")
 
-    z = _normal_inverse_cdf(0.5 + confidence / 2.0)
-    n = float(trials)
-    phat = successes / n
+    z = _Z_TABLE.get(confidence) or _z_for(confidence)
+
+    # Plain Python numbers are by far the common case (report lines), so check
+    # for them before paying for any NumPy dispatch.
+    if isinstance(successes, (int, float)) and isinstance(trials, (int, float)):
+        return _wilson_interval_scalar(successes, trials, z)
 
-    denom = 1.0 + (z**2) / n
-    center = (phat + (z**2) / (2.0 * n)) / denom
-    half_width = (z / denom) * math.sqrt(
-        (phat * (1.0 - phat) / n) + ((z**2) / (4.0 * n * n))
-    )
+    if np.ndim(successes) == 0 and np.ndim(trials) == 0:
+        # .item() turns NumPy scalars and 0-d arrays into plain Python numbers,
+        # so the interval holds floats just as it does for int inputs.
+        return _wilson_interval_scalar(
+            np.asarray(successes).item(), np.asarray(trials).item(), z
+        )
+
+    k = np.asarray(successes, dtype=np.float64)
+    n = np.asarray(trials, dtype=np.float64)
+    if np.any(n <= 0):
+        raise ValueError("trials must be positive.")
+    if np.any((k < 0) | (k > n)):
+        raise ValueError("successes must be between 0 and trials.")
+
+    z2 = z * z
+    phat = k / n
+
+    denom = 1.0 + z2 / n
+    center = (phat + z2 / (2.0 * n)) / denom
+    half_width = (z / denom) * np.sqrt(phat * (1.0 - phat) / n + z2 / (4.0 * n * n))
+
+    # Same closed forms at 0 and trials successes as the scalar kernel.
+    low = np.clip(center - half_width, 0.0, 1.0)
+    high = np.clip(center + half_width, 0.0, 1.0)
+    low = np.where(k == 0, 0.0, np.where(k == n, n / (n + z2), low))
+    high = np.where(k == n, 1.0, np.where(k == 0, z2 / (n + z2), high))
+    return ProportionInterval(estimate=phat, low=low, high=high)
+
+
+def _wilson_interval_scalar(
+    successes: int, trials: int, z: float
+) -> ProportionInterval:
+    if trials <= 0:
+        raise ValueError("trials must be positive.")
+    if successes < 0 or successes > trials:
+        raise ValueError("successes must be between 0 and trials.")
 
-    low = max(0.0, center - half_width)
-    high = min(1.0, center + half_width)
+    phat, low, high = wilson_bounds(successes, trials, z)
     return ProportionInterval(estimate=phat, low=low, high=high)
@@ -11,6 +11,9 @@ from simlab.simulate import (
 )
 from simlab.intervals import wilson_interval
 
+# One bound str.format call for the three numbers beats three f-string fields.
+_FMT_INTERVAL = "{:.3f} (95% CI {:.3f} to {:.3f})".format
+
 
 def _fmt(x: float) -> str:
     return f"{x:.3f}"
@@ -18,7 +21,7 @@ def _fmt(x: float) -> str:
 
 def _fmt_interval(successes: int, trials: int) -> str:
     iv = wilson_interval(successes, trials, confidence=0.95)
-    return f"{iv.estimate:.3f} (95% CI {iv.low:.3f} to {iv.high:.3f})"
+    return _FMT_INTERVAL(iv.estimate, iv.low, iv.high)
 
 
 def print_report() -> None:
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-import random
 from dataclasses import dataclass
-from typing import Callable
 
-from abtk import conversion_diff, mean_diff
-from abtk import ratio_diff
+import numpy as np
+
+from simlab._kernels import (
+    block_buffer,
+    draw_normal_moments,
+    purchase_ratio_p,
+    two_prop_p,
+    welch_p,
+    welch_p_from_moments,
+)
+from simlab._rng import make_rng
 
 
 @dataclass(frozen=True)
@@ -35,20 +42,16 @@ class SimulationResult:
     rejection_rate: float
 
 
-def _run_trials(
-    p_value_fn: Callable[[random.Random], float],
-    *,
-    trials: int,
-    alpha: float,
-    seed: int,
-) -> SimulationResult:
-    rng = random.Random(seed)
-    rejections = 0
+def _check_n_per_group(n_per_group: int) -> None:
+    # Every test divides by n_per_group - 1 for a sample variance, so one user
+    # per group has no defined p-value.
+    if n_per_group < 2:
+        raise ValueError("n_per_group must be at least 2.")
 
-    for _ in range(trials):
-        p = p_value_fn(rng)
-        if p < alpha:
-            rejections += 1
+
+def _summarize(p_values: np.ndarray, *, alpha: float) -> SimulationResult:
+    trials = int(p_values.shape[0])
+    rejections = int((p_values < alpha).sum())
 
     return SimulationResult(
         trials=trials,
@@ -58,6 +61,102 @@ def _run_trials(
     )
 
 
+def simulate_mean_from_arrays(
+    a: np.ndarray, b: np.ndarray, *, alpha: float = 0.05
+) -> SimulationResult:
+    """
+    Rejection rate of the mean test on pre-drawn data, one trial per row.
+
+    a and b have shape (trials, n_per_group). Passing the same a with different
+    b arrays lets several simulations share one draw of group A.
+    """
+    _check_n_per_group(min(a.shape[1], b.shape[1]))
+    return _summarize(welch_p(a, b), alpha=alpha)
+
+
+def simulate_mean_from_moments(
+    mean_a: np.ndarray,
+    var_a: np.ndarray,
+    mean_b: np.ndarray,
+    var_b: np.ndarray,
+    *,
+    n_per_group: int,
+    alpha: float = 0.05,
+) -> SimulationResult:
+    """
+    Rejection rate of the mean test from per-trial sample means and variances.
+
+    Each argument holds one value per trial; variances use ddof=1.
+    """
+    p_values = welch_p_from_moments(
+        mean_a, var_a, n_per_group, mean_b, var_b, n_per_group
+    )
+    return _summarize(p_values, alpha=alpha)
+
+
+def simulate_conversion_from_counts(
+    successes_a: np.ndarray,
+    successes_b: np.ndarray,
+    *,
+    n_per_group: int,
+    alpha: float = 0.05,
+) -> SimulationResult:
+    """
+    Rejection rate of the conversion test on pre-drawn conversion counts.
+
+    successes_a and successes_b hold one count per trial, each out of n_per_group.
+    """
+    return _summarize(two_prop_p(successes_a, successes_b, n_per_group), alpha=alpha)
+
+
+def simulate_ratio_from_counts(
+    purchases_a: np.ndarray,
+    purchases_b: np.ndarray,
+    *,
+    n_per_group: int,
+    purchase_amount: float,
+    alpha: float = 0.05,
+) -> SimulationResult:
+    """
+    Rejection rate of the revenue-per-visitor ratio test on pre-drawn purchase counts.
+
+    purchases_a and purchases_b hold one count per trial, each out of n_per_group.
+    """
+    p_values = purchase_ratio_p(purchases_a, purchases_b, n_per_group, purchase_amount)
+    return _summarize(p_values, alpha=alpha)
+
+
+def _simulate_mean(
+    *,
+    n_per_group: int,
+    mean_a: float,
+    mean_b: float,
+    standard_deviation: float,
+    trials: int,
+    alpha: float,
+    seed: int,
+) -> SimulationResult:
+    """
+    Draw both groups of normal data and run the mean test on every trial.
+
+    Both groups go through one block buffer and are reduced to per-trial moments
+    as they are drawn, so memory does not grow with trials.
+    """
+    _check_n_per_group(n_per_group)
+
+    rng = make_rng(seed)
+    buffer = block_buffer(trials, n_per_group)
+    mean_a_hat, var_a = draw_normal_moments(
+        rng, buffer, trials, mean_a, standard_deviation
+    )
+    mean_b_hat, var_b = draw_normal_moments(
+        rng, buffer, trials, mean_b, standard_deviation
+    )
+    return simulate_mean_from_moments(
+        mean_a_hat, var_a, mean_b_hat, var_b, n_per_group=n_per_group, alpha=alpha
+    )
+
+
 def simulate_type1_error_mean(
     *,
     n_per_group: int,
@@ -73,14 +172,15 @@ def simulate_type1_error_mean(
     We generate both groups from the same distribution (same mean and standard deviation).
     Any "significant" result is a false positive.
     """
-
-    def one_trial(rng: random.Random) -> float:
-        a = [rng.gauss(mean, standard_deviation) for _ in range(n_per_group)]
-        b = [rng.gauss(mean, standard_deviation) for _ in range(n_per_group)]
-        res = mean_diff(a, b, alpha=alpha)
-        return float(res.p_value)
-
-    return _run_trials(one_trial, trials=trials, alpha=alpha, seed=seed)
+    return _simulate_mean(
+        n_per_group=n_per_group,
+        mean_a=mean,
+        mean_b=mean,
+        standard_deviation=standard_deviation,
+        trials=trials,
+        alpha=alpha,
+        seed=seed,
+    )
 
 
 def simulate_power_mean(
@@ -96,14 +196,15 @@ def simulate_power_mean(
     """
     Estimate power for the mean test under a real effect (mean_b - mean_a).
     """
-
-    def one_trial(rng: random.Random) -> float:
-        a = [rng.gauss(mean_a, standard_deviation) for _ in range(n_per_group)]
-        b = [rng.gauss(mean_b, standard_deviation) for _ in range(n_per_group)]
-        res = mean_diff(a, b, alpha=alpha)
-        return float(res.p_value)
-
-    return _run_trials(one_trial, trials=trials, alpha=alpha, seed=seed)
+    return _simulate_mean(
+        n_per_group=n_per_group,
+        mean_a=mean_a,
+        mean_b=mean_b,
+        standard_deviation=standard_deviation,
+        trials=trials,
+        alpha=alpha,
+        seed=seed,
+    )
 
 
 def simulate_type1_error_conversion(
@@ -119,14 +220,14 @@ def simulate_type1_error_conversion(
 
     Both groups have the same true conversion probability.
     """
+    _check_n_per_group(n_per_group)
 
-    def one_trial(rng: random.Random) -> float:
-        a = [1 if rng.random() < conversion_rate else 0 for _ in range(n_per_group)]
-        b = [1 if rng.random() < conversion_rate else 0 for _ in range(n_per_group)]
-        res = conversion_diff(a, b, alpha=alpha)
-        return float(res.p_value)
-
-    return _run_trials(one_trial, trials=trials, alpha=alpha, seed=seed)
+    rng = make_rng(seed)
+    successes_a = rng.binomial(n_per_group, conversion_rate, size=trials)
+    successes_b = rng.binomial(n_per_group, conversion_rate, size=trials)
+    return simulate_conversion_from_counts(
+        successes_a, successes_b, n_per_group=n_per_group, alpha=alpha
+    )
 
 
 def simulate_power_conversion(
@@ -141,14 +242,14 @@ def simulate_power_conversion(
     """
     Estimate power for the conversion test when rate_b differs from rate_a.
     """
+    _check_n_per_group(n_per_group)
 
-    def one_trial(rng: random.Random) -> float:
-        a = [1 if rng.random() < rate_a else 0 for _ in range(n_per_group)]
-        b = [1 if rng.random() < rate_b else 0 for _ in range(n_per_group)]
-        res = conversion_diff(a, b, alpha=alpha)
-        return float(res.p_value)
-
-    return _run_trials(one_trial, trials=trials, alpha=alpha, seed=seed)
+    rng = make_rng(seed)
+    successes_a = rng.binomial(n_per_group, rate_a, size=trials)
+    successes_b = rng.binomial(n_per_group, rate_b, size=trials)
+    return simulate_conversion_from_counts(
+        successes_a, successes_b, n_per_group=n_per_group, alpha=alpha
+    )
 
 
 def simulate_type1_error_ratio(
@@ -169,23 +270,18 @@ def simulate_type1_error_ratio(
 
     Both groups use the same purchase probability, so the true effect is 0.
     """
-
-    def one_trial(rng: random.Random) -> float:
-        a_num = [
-            purchase_amount if rng.random() < purchase_probability else 0.0
-            for _ in range(n_per_group)
-        ]
-        b_num = [
-            purchase_amount if rng.random() < purchase_probability else 0.0
-            for _ in range(n_per_group)
-        ]
-        a_den = [1.0] * n_per_group
-        b_den = [1.0] * n_per_group
-
-        res = ratio_diff(a_num, a_den, b_num, b_den, method="delta", alpha=alpha)
-        return float(res.p_value)
-
-    return _run_trials(one_trial, trials=trials, alpha=alpha, seed=seed)
+    _check_n_per_group(n_per_group)
+
+    rng = make_rng(seed)
+    purchases_a = rng.binomial(n_per_group, purchase_probability, size=trials)
+    purchases_b = rng.binomial(n_per_group, purchase_probability, size=trials)
+    return simulate_ratio_from_counts(
+        purchases_a,
+        purchases_b,
+        n_per_group=n_per_group,
+        purchase_amount=purchase_amount,
+        alpha=alpha,
+    )
 
 
 def simulate_power_ratio(
@@ -204,20 +300,15 @@ def simulate_power_ratio(
     This uses the same revenue-per-visitor data generating process as simulate_type1_error_ratio,
     but with different purchase probabilities in A and B.
     """
-
-    def one_trial(rng: random.Random) -> float:
-        a_num = [
-            purchase_amount if rng.random() < purchase_probability_a else 0.0
-            for _ in range(n_per_group)
-        ]
-        b_num = [
-            purchase_amount if rng.random() < purchase_probability_b else 0.0
-            for _ in range(n_per_group)
-        ]
-        a_den = [1.0] * n_per_group
-        b_den = [1.0] * n_per_group
-
-        res = ratio_diff(a_num, a_den, b_num, b_den, method="delta", alpha=alpha)
-        return float(res.p_value)
-
-    return _run_trials(one_trial, trials=trials, alpha=alpha, seed=seed)
+    _check_n_per_group(n_per_group)
+
+    rng = make_rng(seed)
+    purchases_a = rng.binomial(n_per_group, purchase_probability_a, size=trials)
+    purchases_b = rng.binomial(n_per_group, purchase_probability_b, size=trials)
+    return simulate_ratio_from_counts(
+        purchases_a,
+        purchases_b,
+        n_per_group=n_per_group,
+        purchase_amount=purchase_amount,
+        alpha=alpha,
+    )
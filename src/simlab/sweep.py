@@ -1,23 +1,115 @@
 from __future__ import annotations
 
 import csv
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Sequence
+from typing import Callable, Iterable, Iterator, List, Sequence, Tuple
 
+from simlab._kernels import block_buffer, draw_normal_moments
+from simlab._rng import make_rng
 from simlab.simulate import (
-    simulate_power_conversion,
-    simulate_power_mean,
-    simulate_power_ratio,
-    simulate_type1_error_conversion,
-    simulate_type1_error_mean,
-    simulate_type1_error_ratio,
+    SimulationResult,
+    _check_n_per_group,
+    simulate_conversion_from_counts,
+    simulate_mean_from_moments,
+    simulate_ratio_from_counts,
 )
 
 
+def _mean_pair(
+    *, n_per_group: int, trials: int, alpha: float, seed: int
+) -> Tuple[SimulationResult, SimulationResult]:
+    """
+    Type I error and power for the mean metric, sharing one draw of group A.
+    """
+    rng = make_rng(seed)
+    buffer = block_buffer(trials, n_per_group)
+    mean_a, var_a = draw_normal_moments(rng, buffer, trials, 0.0, 1.0)
+    mean_null, var_null = draw_normal_moments(rng, buffer, trials, 0.0, 1.0)
+    mean_effect, var_effect = draw_normal_moments(rng, buffer, trials, 0.3, 1.0)
+
+    common = {"n_per_group": n_per_group, "alpha": alpha}
+    return (
+        simulate_mean_from_moments(mean_a, var_a, mean_null, var_null, **common),
+        simulate_mean_from_moments(mean_a, var_a, mean_effect, var_effect, **common),
+    )
+
+
+def _conversion_pair(
+    *, n_per_group: int, trials: int, alpha: float, seed: int
+) -> Tuple[SimulationResult, SimulationResult]:
+    """
+    Type I error and power for the conversion metric, sharing group A's counts.
+    """
+    rng = make_rng(seed)
+    successes_a = rng.binomial(n_per_group, 0.08, size=trials)
+    successes_b_null = rng.binomial(n_per_group, 0.08, size=trials)
+    successes_b_effect = rng.binomial(n_per_group, 0.095, size=trials)
+
+    return (
+        simulate_conversion_from_counts(
+            successes_a, successes_b_null, n_per_group=n_per_group, alpha=alpha
+        ),
+        simulate_conversion_from_counts(
+            successes_a, successes_b_effect, n_per_group=n_per_group, alpha=alpha
+        ),
+    )
+
+
+def _ratio_pair(
+    *, n_per_group: int, trials: int, alpha: float, seed: int
+) -> Tuple[SimulationResult, SimulationResult]:
+    """
+    Type I error and power for revenue per visitor, sharing group A's purchases.
+    """
+    rng = make_rng(seed)
+    purchases_a = rng.binomial(n_per_group, 0.05, size=trials)
+    purchases_b_null = rng.binomial(n_per_group, 0.05, size=trials)
+    purchases_b_effect = rng.binomial(n_per_group, 0.06, size=trials)
+
+    common = {"n_per_group": n_per_group, "purchase_amount": 120.0, "alpha": alpha}
+    return (
+        simulate_ratio_from_counts(purchases_a, purchases_b_null, **common),
+        simulate_ratio_from_counts(purchases_a, purchases_b_effect, **common),
+    )
+
+
+# Type I error and power for the same metric share group A, so each task
+# returns both columns: (simulation pair, seed offset).
+_PAIRS: List[Tuple[Callable[..., Tuple[SimulationResult, ...]], int]] = [
+    (_mean_pair, 10_000),
+    (_conversion_pair, 30_000),
+    (_ratio_pair, 50_000),
+]
+
+_FIELDNAMES = [
+    "n_per_group",
+    "alpha",
+    "trials",
+    "type1_mean",
+    "power_mean",
+    "type1_conversion",
+    "power_conversion",
+    "type1_ratio",
+    "power_ratio",
+]
+
+
 def _ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def _rows(
+    sample_sizes: Sequence[int],
+    alpha: float,
+    trials: int,
+    results: Iterable[List[Tuple[SimulationResult, ...]]],
+) -> Iterator[tuple]:
+    for n, pairs in zip(sample_sizes, results):
+        rates = [res.rejection_rate for pair in pairs for res in pair]
+        yield (n, alpha, trials, *rates)
+
+
 def run_sweep_to_csv(
     *,
     output_path: str,
@@ -25,6 +117,7 @@ def run_sweep_to_csv(
     alpha: float,
     sample_sizes: Sequence[int],
     seed_base: int = 0,
+    max_workers: int = 1,
 ) -> None:
     """
     Run a small sweep across sample sizes and write results to a CSV file.
@@ -35,88 +128,66 @@ def run_sweep_to_csv(
     - easy to share
 
     Each row corresponds to one simulated setting and reports the rejection rate.
+
+    For each metric and sample size, the Type I error and power simulations share
+    one draw of group A. Rows are written as soon as their simulations finish
+    rather than collected first.
+
+    Each (metric, sample size) pair is independent of the others. By default they
+    run inline, since each takes milliseconds and starting worker processes
+    (which re-import NumPy, SciPy and Numba) usually costs more than it saves.
+    With max_workers > 1 they run in a process pool of at most that many workers,
+    which pays off for large trials and sample sizes. Results are identical
+    either way. On platforms that start workers with "spawn" (macOS, Windows),
+    a script that passes max_workers > 1 must call this from under an
+    `if __name__ == "__main__":` guard.
     """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    # Check every size before any worker starts, so a bad size fails the same
+    # way with or without Numba and without leaving a half-written file.
+    for n in sample_sizes:
+        _check_n_per_group(n)
+
     out = Path(output_path)
     _ensure_parent(out)
 
-    rows: List[dict] = []
-
-    for i, n in enumerate(sample_sizes):
-        # Mean metric settings
-        mean_t1 = simulate_type1_error_mean(
-            n_per_group=n,
-            mean=0.0,
-            standard_deviation=1.0,
-            trials=trials,
-            alpha=alpha,
-            seed=seed_base + 10_000 + i,
-        )
-        mean_pw = simulate_power_mean(
-            n_per_group=n,
-            mean_a=0.0,
-            mean_b=0.3,
-            standard_deviation=1.0,
-            trials=trials,
-            alpha=alpha,
-            seed=seed_base + 20_000 + i,
-        )
-
-        # Conversion settings
-        conv_t1 = simulate_type1_error_conversion(
-            n_per_group=n,
-            conversion_rate=0.08,
-            trials=trials,
-            alpha=alpha,
-            seed=seed_base + 30_000 + i,
-        )
-        conv_pw = simulate_power_conversion(
-            n_per_group=n,
-            rate_a=0.08,
-            rate_b=0.095,
-            trials=trials,
-            alpha=alpha,
-            seed=seed_base + 40_000 + i,
-        )
-
-        # Ratio settings (revenue per visitor)
-        ratio_t1 = simulate_type1_error_ratio(
-            n_per_group=n,
-            purchase_probability=0.05,
-            purchase_amount=120.0,
-            trials=trials,
-            alpha=alpha,
-            seed=seed_base + 50_000 + i,
-        )
-        ratio_pw = simulate_power_ratio(
-            n_per_group=n,
-            purchase_probability_a=0.05,
-            purchase_probability_b=0.06,
-            purchase_amount=120.0,
-            trials=trials,
-            alpha=alpha,
-            seed=seed_base + 60_000 + i,
-        )
-
-        rows.append(
-            {
-                "n_per_group": n,
-                "alpha": alpha,
-                "trials": trials,
-                "type1_mean": mean_t1.rejection_rate,
-                "power_mean": mean_pw.rejection_rate,
-                "type1_conversion": conv_t1.rejection_rate,
-                "power_conversion": conv_pw.rejection_rate,
-                "type1_ratio": ratio_t1.rejection_rate,
-                "power_ratio": ratio_pw.rejection_rate,
-            }
-        )
-
-    fieldnames = list(rows[0].keys())
+    # Each task carries its own seed, so results do not depend on which
+    # process runs it or in what order.
+    row_tasks = [
+        [
+            (
+                fn,
+                {
+                    "n_per_group": n,
+                    "trials": trials,
+                    "alpha": alpha,
+                    "seed": seed_base + seed_offset + i,
+                },
+            )
+            for fn, seed_offset in _PAIRS
+        ]
+        for i, n in enumerate(sample_sizes)
+    ]
+
     with out.open("w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
+        writer = csv.writer(f)
+        writer.writerow(_FIELDNAMES)
+
+        workers = min(max_workers, len(sample_sizes) * len(_PAIRS))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                pending = [
+                    [ex.submit(fn, **kwargs) for fn, kwargs in tasks]
+                    for tasks in row_tasks
+                ]
+                results = (
+                    [future.result() for future in futures] for futures in pending
+                )
+                writer.writerows(_rows(sample_sizes, alpha, trials, results))
+        else:
+            results = ([fn(**kwargs) for fn, kwargs in tasks] for tasks in row_tasks)
+            writer.writerows(_rows(sample_sizes, alpha, trials, results))
 
 
 def main() -> None:
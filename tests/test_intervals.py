@@ -1,3 +1,5 @@
+import numpy as np
+
 from simlab.intervals import wilson_interval
 
 
@@ -14,3 +16,38 @@ def test_wilson_interval_extremes():
     iv1 = wilson_interval(successes=100, trials=100, confidence=0.95)
     assert iv1.high == 1.0
     assert iv1.low < 1.0
+
+
+def test_wilson_interval_accepts_arrays():
+    successes = list(range(101))
+    ivs = wilson_interval(successes=successes, trials=[100] * len(successes))
+    for i, k in enumerate(successes):
+        iv = wilson_interval(successes=k, trials=100)
+        assert ivs.estimate[i] == iv.estimate == k / 100
+        assert abs(ivs.low[i] - iv.low) < 1e-12
+        assert abs(ivs.high[i] - iv.high) < 1e-12
+
+
+def test_wilson_interval_extremes_use_closed_form():
+    z2 = 1.959963984540054**2
+    iv0 = wilson_interval(successes=0, trials=100, confidence=0.95)
+    assert abs(iv0.high - z2 / (100 + z2)) < 1e-12
+
+    iv1 = wilson_interval(successes=100, trials=100, confidence=0.95)
+    assert abs(iv1.low - 100 / (100 + z2)) < 1e-12
+
+
+def test_normal_inverse_cdf_accepts_arrays():
+    from simlab import intervals
+
+    probabilities = [1e-6, 0.01, 0.3, 0.5, 0.975, 0.9999]
+    values = intervals._normal_inverse_cdf(probabilities)
+    for p, value in zip(probabilities, values):
+        assert value == intervals._normal_inverse_cdf(p)
+    assert abs(intervals._normal_inverse_cdf(0.975) - 1.959963984540054) < 1e-12
+
+
+def test_wilson_interval_accepts_zero_dimensional_arrays():
+    iv = wilson_interval(successes=np.array(3), trials=np.array(10))
+    assert iv == wilson_interval(successes=3, trials=10)
+    assert isinstance(iv.low, float)
@@ -0,0 +1,77 @@
+import numpy as np
+from scipy import stats
+
+from simlab._kernels import (
+    draw_normal_moments,
+    purchase_ratio_p,
+    ratio_delta_p,
+    two_prop_p,
+    welch_p,
+)
+from simlab._rng import make_rng
+
+
+def test_welch_p_matches_scipy_ttest():
+    rng = np.random.default_rng(0)
+    a = rng.normal(0.0, 1.0, (5, 40))
+    b = rng.normal(0.3, 2.0, (5, 40))
+    expected = stats.ttest_ind(a, b, axis=1, equal_var=False).pvalue
+    assert np.allclose(welch_p(a, b), expected)
+
+
+def test_two_prop_p_is_one_when_groups_match():
+    p = two_prop_p(np.array([0, 10, 500]), np.array([0, 10, 500]), 500)
+    assert np.allclose(p, 1.0)
+
+
+def test_ratio_delta_p_with_unit_denominators_is_a_z_test_on_means():
+    rng = np.random.default_rng(1)
+    num_a = rng.exponential(1.0, (4, 200))
+    num_b = rng.exponential(1.2, (4, 200))
+    ones = np.ones_like(num_a)
+
+    se = np.sqrt(num_a.var(axis=1, ddof=1) / 200 + num_b.var(axis=1, ddof=1) / 200)
+    z = (num_b.mean(axis=1) - num_a.mean(axis=1)) / se
+    expected = 2.0 * stats.norm.sf(np.abs(z))
+    assert np.allclose(ratio_delta_p(num_a, num_b, ones, ones), expected)
+
+
+def test_ratio_delta_p_broadcasts_shared_denominators():
+    rng = np.random.default_rng(2)
+    num_a = rng.exponential(1.0, (3, 50))
+    num_b = rng.exponential(1.0, (3, 50))
+    den = rng.uniform(0.5, 1.5, 50)
+    full = np.tile(den, (3, 1))
+    assert np.allclose(
+        ratio_delta_p(num_a, num_b, den, den),
+        ratio_delta_p(num_a, num_b, full, full),
+    )
+
+
+def test_purchase_ratio_p_matches_ratio_delta_p_on_user_level_data():
+    rng = np.random.default_rng(3)
+    purchases_a = rng.random((6, 300)) < 0.05
+    purchases_b = rng.random((6, 300)) < 0.07
+    ones = np.ones(300)
+
+    expected = ratio_delta_p(purchases_a * 120.0, purchases_b * 120.0, ones, ones)
+    p = purchase_ratio_p(purchases_a.sum(axis=1), purchases_b.sum(axis=1), 300, 120.0)
+    assert np.allclose(p, expected)
+
+
+def test_two_prop_p_matches_pooled_z_test():
+    ka = np.array([40, 55, 61])
+    kb = np.array([52, 48, 80])
+    pooled = (ka + kb) / 1000
+    z = (kb - ka) / 500 / np.sqrt(pooled * (1 - pooled) * (2 / 500))
+    expected = 2.0 * stats.norm.sf(np.abs(z))
+    assert np.allclose(two_prop_p(ka, kb, 500), expected)
+
+
+def test_normal_moments_do_not_depend_on_block_size():
+    small = np.empty((7, 50), dtype=np.float32)
+    large = np.empty((100, 50), dtype=np.float32)
+    m1, v1 = draw_normal_moments(make_rng(0), small, 100, 1.0, 2.0)
+    m2, v2 = draw_normal_moments(make_rng(0), large, 100, 1.0, 2.0)
+    assert np.array_equal(m1, m2)
+    assert np.array_equal(v1, v2)
@@ -1,4 +1,9 @@
+import numpy as np
+import pytest
+
+from simlab._rng import make_rng
 from simlab.simulate import (
+    simulate_mean_from_arrays,
     simulate_power_conversion,
     simulate_power_mean,
     simulate_type1_error_conversion,
@@ -106,3 +111,27 @@ def test_power_ratio_increases_with_lift():
         seed=5,
     )
     assert high.rejection_rate > low.rejection_rate
+
+
+def test_mean_from_arrays_matches_simulate_type1_error_mean():
+    rng = make_rng(0)
+    draws = rng.standard_normal((2, 800, 200), dtype=np.float32)
+    res = simulate_mean_from_arrays(draws[0], draws[1], alpha=0.05)
+    expected = simulate_type1_error_mean(
+        n_per_group=200,
+        mean=0.0,
+        standard_deviation=1.0,
+        trials=800,
+        alpha=0.05,
+        seed=0,
+    )
+    assert res == expected
+
+
+def test_single_user_per_group_is_rejected():
+    with pytest.raises(ValueError):
+        simulate_type1_error_mean(n_per_group=1, mean=0.0, standard_deviation=1.0)
+    with pytest.raises(ValueError):
+        simulate_power_conversion(n_per_group=1, rate_a=0.1, rate_b=0.2)
+    with pytest.raises(ValueError):
+        simulate_mean_from_arrays(np.zeros((5, 1)), np.zeros((5, 1)))
@@ -1,5 +1,8 @@
+import csv
 from pathlib import Path
 
+import pytest
+
 from simlab.sweep import run_sweep_to_csv
 
 
@@ -16,3 +19,46 @@ def test_run_sweep_to_csv_writes_file(tmp_path: Path):
     text = out.read_text()
     assert "n_per_group" in text
     assert "power_conversion" in text
+
+
+def _read_rows(path: Path) -> list:
+    with path.open(newline="") as f:
+        return list(csv.reader(f))[1:]
+
+
+def test_run_sweep_to_csv_rows_are_numeric_rates(tmp_path: Path):
+    out = tmp_path / "sweep.csv"
+    run_sweep_to_csv(
+        output_path=str(out),
+        trials=200,
+        alpha=0.05,
+        sample_sizes=[50, 100],
+        seed_base=123,
+    )
+    rows = _read_rows(out)
+    assert [int(row[0]) for row in rows] == [50, 100]
+    for row in rows:
+        assert len(row) == 9
+        values = [float(value) for value in row]
+        assert all(0.0 <= rate <= 1.0 for rate in values[3:])
+
+
+def test_run_sweep_to_csv_rows_match_inline_and_in_pool(tmp_path: Path):
+    inline = tmp_path / "inline.csv"
+    pooled = tmp_path / "pooled.csv"
+    common = {"trials": 200, "alpha": 0.05, "seed_base": 7}
+    run_sweep_to_csv(output_path=str(inline), sample_sizes=[50], **common)
+    run_sweep_to_csv(
+        output_path=str(pooled), sample_sizes=[50, 100], max_workers=2, **common
+    )
+    assert _read_rows(inline)[0] == _read_rows(pooled)[0]
+
+
+def test_run_sweep_to_csv_rejects_single_user_groups(tmp_path: Path):
+    with pytest.raises(ValueError):
+        run_sweep_to_csv(
+            output_path=str(tmp_path / "sweep.csv"),
+            trials=10,
+            alpha=0.05,
+            sample_sizes=[50, 1],
+        )